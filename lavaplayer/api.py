@@ -1,4 +1,8 @@
+import asyncio
+import os
+import typing as t
 import aiohttp
+import orjson
 
 
 class Api:
@@ -15,15 +19,34 @@ class Api:
         The password used for authentication.
     is_ssl: :class:`bool`
         Is server using ssl
+    session: :class:`aiohttp.ClientSession`
+        a session to share for requests, if not give the session will created on the first request
+
+    .. note::
+        At most ``LAVAPLAYER_MAX_CONCURRENT_REST`` (default ``32``) requests are in flight at once, the rest wait their turn.
     """
-    def __init__(self, *, host: str = "127.0.0.1", port: int, password: str, is_ssl: bool = False) -> None:
+    def __init__(self, *, host: str = "127.0.0.1", port: int, password: str, is_ssl: bool = False, session: t.Optional[aiohttp.ClientSession] = None) -> None:
         self.rest_uri = f"{'https' if is_ssl else 'http'}://{host}:{port}"
         self.headers = {
             "Host": f"{host}:{port}",
             "Authorization": password
         }
-    
-    async def request(self, method: str, rout: str, data: dict = {}) -> dict:
+        self._session = session
+        self._max_concurrent = int(os.environ.get("LAVAPLAYER_MAX_CONCURRENT_REST", "32"))
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The keep-alive session used for all requests, it's created on first use because aiohttp need a running loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def request(self, method: str, rout: str, data: dict = {}, json: t.Optional[t.Any] = None) -> dict:
         """
         This function makes a request to the rest api for lavalink
 
@@ -35,7 +58,20 @@ class Api:
             rout from request like `/loadtracks`
         data: :class:`dict`
             data for request
+        json: :class:`Any`
+            json body for request, used instead of ``data`` when given
+        """
+        if json is not None:
+            data = None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        async with self._semaphore:
+            async with self.session.request(method, self.rest_uri + rout, data=data, json=json, headers=self.headers) as resp:
+                return await resp.json(loads=orjson.loads)
+
+    async def close(self) -> None:
+        """
+        Close the session and all pooled connections.
         """
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.request(method, self.rest_uri + rout, data=data) as resp:
-                return await resp.json()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -1,5 +1,7 @@
 import asyncio
+import aiohttp
 import typing as t
+from collections import OrderedDict
 from lavaplayer.exceptions import NodeError, VolumeError, TrackLoadFailed
 from typing import Dict
 
@@ -11,6 +13,79 @@ from lavaplayer import __version__
 import random
 
 
+_WSS_PREFIX = "wss://"
+
+
+class _DecodeBatcher:
+    """
+    Coalesce decode requests made at the same time into one ``POST /decodetracks`` call.
+    """
+    def __init__(self, client: "LavalinkClient", max_size: int = 32) -> None:
+        self._client = client
+        self._max_size = max_size
+        self._queue: t.Optional[asyncio.Queue] = None
+        self._task: t.Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = self._client._loop.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    async def decode(self, track: str) -> Track:
+        future = self._client._loop.create_future()
+        await self._queue.put((track, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # one loop pass lets the other handlers woken with this one queue their tracks too, no timer wait
+            await asyncio.sleep(0)
+            while len(batch) < self._max_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._resolve(batch)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+
+    async def _resolve(self, batch: t.List[t.Tuple[str, asyncio.Future]]) -> None:
+        tracks = list(dict.fromkeys(track for track, _ in batch))
+        if len(tracks) == 1:
+            decoded = {tracks[0]: await self._client._fetch_payload(tracks[0])}
+        else:
+            # keyed by each result's own track string, lavalink may leave some out
+            decoded = {payload["track"]: payload for payload in await self._client._fetch_payloads(tracks)}
+        for track, future in batch:
+            if future.done():
+                continue
+            payload = decoded.get(track)
+            if payload is None:
+                future.set_exception(TrackLoadFailed("Lavalink did not decode the track", "COMMON"))
+                continue
+            # every waiter gets its own object, the same track can be decoded for two guilds at once
+            future.set_result(Track.from_payload(payload))
+
+
 class LavalinkClient:
     """
     Represents a Lavalink client used to manage nodes and connections.
@@ -62,26 +137,23 @@ class LavalinkClient:
         self._api = Api(host=self.host, port=self.port, password=self.password, is_ssl=self.is_ssl)
         self._nodes: Dict[int, Node] = {}
         self._voice_handlers: Dict[int, ConnectionInfo] = {}
+        self._track_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._track_cache_max = 512
+        self._decode_batcher = _DecodeBatcher(self)
+        self._node_events: Dict[int, asyncio.Event] = {}
+        self._node_removed_events: Dict[int, asyncio.Event] = {}
+
+    def _cache_payload(self, payload: dict) -> None:
+        # the raw payload is cached, a hit builds a new Track so queued tracks are never shared
+        self._track_cache[payload["track"]] = payload
+        self._track_cache.move_to_end(payload["track"])
+        if len(self._track_cache) > self._track_cache_max:
+            self._track_cache.popitem(last=False)
 
     def _prossing_tracks(self, tracks: list) -> t.List[Track]:
-        _tracks = []
         for track in tracks:
-            info = track["info"]
-            _tracks.append(
-                Track(
-                    track=track["track"],
-                    identifier=info["identifier"],
-                    isSeekable=info["isSeekable"],
-                    author=info["author"],
-                    length=info["length"],
-                    isStream=info["isStream"],
-                    position=info["position"],
-                    sourceName=info.get("sourceName", None),
-                    title=info.get("title", None),
-                    uri=info["uri"]
-                )
-            )
-        return _tracks
+            self._cache_payload(track)
+        return [Track.from_payload(track) for track in tracks]
 
     async def voice_update(self, guild_id: int, /, session_id: str, token: str, endpoint: str, channel_id: t.Optional[int]) -> None:
         """
@@ -103,14 +175,17 @@ class LavalinkClient:
         if not channel_id:
             await self.destroy(guild_id)
             return
+        guild_id_str = str(guild_id)
+        if endpoint.startswith(_WSS_PREFIX):  # str.removeprefix is python 3.9+
+            endpoint = endpoint[len(_WSS_PREFIX):]
         await self._ws.send({
             "op": "voiceUpdate",
-            "guildId": str(guild_id),
+            "guildId": guild_id_str,
             "sessionId": session_id,
             "event": {
                 "token": token,
-                "guild_id": str(guild_id),
-                "endpoint": endpoint.replace("wss://", "")
+                "guild_id": guild_id_str,
+                "endpoint": endpoint
             }
         })
         await self.create_new_node(guild_id, is_connected=True)
@@ -118,6 +193,8 @@ class LavalinkClient:
     async def create_new_node(self, guild_id: int, /, is_connected: bool = False) -> Node:
         node = Node(guild_id, [], 100, is_connected=is_connected)
         self._nodes[guild_id] = node
+        self._node_removed_events.setdefault(guild_id, asyncio.Event()).clear()
+        self._node_events.setdefault(guild_id, asyncio.Event()).set()
         return node
 
     async def search_youtube(self, query: str) -> t.Union[t.Optional[t.List[Track]], t.Optional[PlayList]]:
@@ -165,12 +242,28 @@ class LavalinkClient:
         return self._prossing_tracks(result["tracks"])
 
     async def _decodetrack(self, track: str) -> Track:
+        cached = self._track_cache.get(track)
+        if cached is not None:
+            self._track_cache.move_to_end(track)
+            return Track.from_payload(cached)
+        if self._decode_batcher.is_running:
+            return await self._decode_batcher.decode(track)
+        return Track.from_payload(await self._fetch_payload(track))
+
+    async def _fetch_payload(self, track: str) -> dict:
         result = await self._api.request("GET", "/decodetrack", data={"track": track})
-        return Track(track, **result)
+        payload = {"track": track, "info": result}
+        self._cache_payload(payload)
+        return payload
 
-    async def _decodetracks(self, tracks: t.List[t.Dict]) -> t.List[Track]:
-        result = await self._api.request("POST", "/decodetrack", json=tracks)
-        return self._prossing_tracks(result)
+    async def _fetch_payloads(self, tracks: t.List[str]) -> t.List[dict]:
+        payloads = await self._api.request("POST", "/decodetracks", json=tracks)
+        for payload in payloads:
+            self._cache_payload(payload)
+        return payloads
+
+    async def _decodetracks(self, tracks: t.List[str]) -> t.List[Track]:
+        return [Track.from_payload(payload) for payload in await self._fetch_payloads(tracks)]
 
     async def auto_search_tracks(self, query: str) -> t.Union[t.Optional[t.List[Track]], t.Optional[PlayList]]:
         """
@@ -186,7 +279,7 @@ class LavalinkClient:
         :class:`lavaplayer.exceptions.TrackLoadFailed`
             If the track could not be loaded.
         """
-        if "http" in query:
+        if query.startswith(("http://", "https://")):
             return await self.get_tracks(query)
         return await self.search_youtube(query)
 
@@ -204,12 +297,17 @@ class LavalinkClient:
         tracks: :class:`list`
             tracks to add to queue
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
-
+        if not tracks:
+            return
         for track in tracks:
-            self._loop.create_task(self.play(guild_id, track, requester))
+            track.requester = requester
+        was_empty = not node.queue
+        node.queue.extend(tracks)
+        if was_empty:
+            await self._ws.send(self._play_payload(node, tracks[0]))
 
     async def get_guild_node(self, guild_id: int, /) -> t.Optional[Node]:
         """
@@ -220,8 +318,12 @@ class LavalinkClient:
         guild_id: :class:`int`
             guild id for server
         """
-        node = self._nodes.get(guild_id)
-        return node
+        return self._nodes.get(guild_id)
+
+    def _clear_nodes(self) -> None:
+        self._nodes.clear()
+        for event in self._node_removed_events.values():
+            event.set()
 
     async def remove_guild_node(self, guild_id: int, /) -> None:
         """
@@ -232,8 +334,10 @@ class LavalinkClient:
         guild_id: :class:`int`
             guild id for server
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         self._nodes.pop(node.guild_id)
+        self._node_events.setdefault(guild_id, asyncio.Event()).clear()
+        self._node_removed_events.setdefault(guild_id, asyncio.Event()).set()
 
     async def set_guild_node(self, guild_id: int, /, node: Node) -> None:
         """
@@ -244,7 +348,6 @@ class LavalinkClient:
         guild_id: :class:`int`
             guild id for server
         """
-        await self.get_guild_node(guild_id)
         self._nodes[guild_id] = node
 
     async def queue(self, guild_id: int, /) -> t.List[Track]:
@@ -256,7 +359,7 @@ class LavalinkClient:
         guild_id: :class:`int`
             guild id for server
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         return node.queue
 
     async def repeat(self, guild_id: int, /, stats: bool) -> None:
@@ -270,9 +373,17 @@ class LavalinkClient:
         stats: :class:`bool`
             the stats for repeat track
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         node.repeat = stats
-        await self.set_guild_node(guild_id, node)
+
+    def _play_payload(self, node: Node, track: Track) -> dict:
+        return {
+            "op": "play",
+            "guildId": node._guild_id_str,
+            "track": track.track,
+            "startTime": "0",
+            "noReplace": False
+        }
 
     async def play(self, guild_id: int, /, track: Track, requester: t.Optional[int] = None, start: bool = False) -> None:
         """
@@ -292,22 +403,15 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
-        payload = {
-            "op": "play",
-            "guildId": str(guild_id),
-            "track": track.track,
-            "startTime": "0",
-            "noReplace": False
-        }
+        payload = self._play_payload(node, track)
         if start:
             await self._ws.send(payload)
             return
         track.requester = requester
         node.queue.append(track)
-        await self.set_guild_node(guild_id, node)
         if len(node.queue) != 1:
             return
         await self._ws.send(payload)
@@ -328,10 +432,10 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
-        filters._payload["guildId"] = str(guild_id)
+        filters._payload["guildId"] = node._guild_id_str
         await self._ws.send(filters._payload)
 
     async def stop(self, guild_id: int, /) -> None:
@@ -348,15 +452,11 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if len(node.queue) == 0:
             raise NodeError("Node not found", guild_id)
         node.queue.clear()
-        await self.set_guild_node(guild_id, node)
-        await self._ws.send({
-            "op": "stop",
-            "guildId": str(guild_id)
-        })
+        await self._ws.send(node._stop_payload)
         return node
 
     async def skip(self, guild_id: int, /) -> None:
@@ -373,15 +473,12 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         if len(node.queue) == 0:
             return
-        await self._ws.send({
-            "op": "stop",
-            "guildId": str(guild_id)
-        })
+        await self._ws.send(node._stop_payload)
         return node
 
     async def pause(self, guild_id: int, /, stats: bool) -> None:
@@ -400,12 +497,12 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         await self._ws.send({
             "op": "pause",
-            "guildId": str(guild_id),
+            "guildId": node._guild_id_str,
             "pause": stats
         })
 
@@ -425,12 +522,12 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         await self._ws.send({
             "op": "seek",
-            "guildId": str(guild_id),
+            "guildId": node._guild_id_str,
             "position": position
         })
 
@@ -456,14 +553,13 @@ class LavalinkClient:
         """
         if volume < 0 or volume > 1000:
             raise VolumeError("Volume may range from 0 to 1000. 100 is default", guild_id)
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         node.volume = volume
-        await self.set_guild_node(guild_id, node)
         await self._ws.send({
             "op": "volume",
-            "guildId": str(guild_id),
+            "guildId": node._guild_id_str,
             "volume": volume
         })
 
@@ -483,14 +579,11 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         await self.remove_guild_node(guild_id)
-        await self._ws.send({
-            "op": "destroy",
-            "guildId": str(guild_id)
-        })
+        await self._ws.send(node._destroy_payload)
 
     async def shuffle(self, guild_id: int, /) -> t.Optional[Node]:
         """
@@ -506,16 +599,16 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
         if not node.queue:
             return []
-        np = node.queue[0]
-        node.queue.remove(np)
-        node.queue = random.sample(node.queue, len(node.queue))
-        node.queue.insert(0, np)
-        await self.set_guild_node(guild_id, node)
+        if len(node.queue) <= 1:
+            return node
+        tail = node.queue[1:]
+        random.shuffle(tail)
+        node.queue[1:] = tail
         return node
 
     async def raw_voice_state_update(self, guild_id: int, /, user_id: int, session_id: str, channel_id: t.Optional[int]) -> None:
@@ -567,9 +660,11 @@ class LavalinkClient:
         guild_id: :class:`int`
             guild id for server
         """
-        while not (await self.get_guild_node(guild_id)):
-            await asyncio.sleep(0.1)
-        return await self.get_guild_node(guild_id)
+        event = self._node_events.setdefault(guild_id, asyncio.Event())
+        while guild_id not in self._nodes:
+            event.clear()
+            await event.wait()
+        return self._nodes[guild_id]
 
     async def wait_for_remove_connection(self, guild_id: int, /) -> None:
         """
@@ -585,21 +680,23 @@ class LavalinkClient:
         :exc:`.NodeError`
             If guild not found in nodes cache.
         """
-        node = await self.get_guild_node(guild_id)
+        node = self._nodes.get(guild_id)
         if not node:
             raise NodeError("Node not found", guild_id)
-        while (await self.get_guild_node(guild_id)):
-            await asyncio.sleep(0.1)
+        event = self._node_removed_events.setdefault(guild_id, asyncio.Event())
+        while guild_id in self._nodes:
+            event.clear()
+            await event.wait()
 
     def _raise_or_emit(self, exception: Exception, *args, **kwargs) -> None:
         """
         This function is used to raise or emit an exception. its not a complete becuse i need to save listener with asyncio.futures but not now.
         """
-        listeners = self.event_manger.listeners
+        listeners = self.event_manager.listeners
         error_handler = [i for i in listeners if i["event"] == "ErrorEvent"]
         if not error_handler:
             raise exception(*args, **kwargs)
-        self.event_manger.emit(ErrorEvent, ErrorEvent(args[0], exception))
+        self.event_manager.emit(ErrorEvent, ErrorEvent(args[0], exception))
 
     def listen(self, event: t.Union[str, Event]) -> t.Callable[..., t.Awaitable]:
         """
@@ -625,7 +722,20 @@ class LavalinkClient:
         """
         Connect to the lavalink websocket
         """
-        self._loop.create_task(self._ws._connect())
+        self._decode_batcher.start()
+        self._ws.start()
+
+    async def aclose(self) -> None:
+        """
+        Close the websocket and the shared session for REST and websocket connections.
+        """
+        self._decode_batcher.stop()
+        await self._ws.close()
+        await self._api.close()
+
+    @property
+    def _session(self) -> aiohttp.ClientSession:
+        return self._api.session
 
     @property
     def nodes(self):
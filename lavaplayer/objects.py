@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from lavaplayer.exceptions import FiltersError
 import typing as t
+import sys
+
+
+# ``slots`` is only accepted by dataclass on python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Event:
@@ -9,7 +14,7 @@ class Event:
     """
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Info:
     """
     Info websocket for connection
@@ -21,7 +26,7 @@ class Info:
     uptime: int
 
 
-@dataclass(repr=True)
+@dataclass(repr=True, **_SLOTS)
 class Track:
     """
     Info track object.
@@ -41,6 +46,31 @@ class Track:
     optional option to save a requester for the track
     """
 
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Track":
+        """
+        Build a track from a lavalink track payload without going through ``__init__``.
+
+        Parameters
+        ---------
+        payload: :class:`dict`
+            the track payload, it's have ``track`` and ``info`` keys
+        """
+        info = payload["info"]
+        self = cls.__new__(cls)
+        self.track = payload["track"]
+        self.identifier = info["identifier"]
+        self.isSeekable = info["isSeekable"]
+        self.author = info["author"]
+        self.length = info["length"]
+        self.isStream = info["isStream"]
+        self.position = info["position"]
+        self.title = info.get("title", None)
+        self.uri = info["uri"]
+        self.requester = None
+        self.sourceName = info.get("sourceName", None)
+        return self
+
     def __repr__(self) -> str:
         return self.title
 
@@ -130,6 +160,14 @@ class Node:
     is_pause: bool = False
     repeat: bool = False
     is_connected: bool = False
+    _guild_id_str: str = field(init=False, repr=False, compare=False)
+    _stop_payload: dict = field(init=False, repr=False, compare=False)
+    _destroy_payload: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._guild_id_str = str(self.guild_id)
+        self._stop_payload = {"op": "stop", "guildId": self._guild_id_str}
+        self._destroy_payload = {"op": "destroy", "guildId": self._guild_id_str}
 
 
 @dataclass
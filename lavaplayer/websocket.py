@@ -1,9 +1,12 @@
 import asyncio
 import aiohttp
 import logging
-from lavaplayer.exceptions import NodeError
+import orjson
+from collections import deque
 from .objects import (
     Info,
+    Node,
+    Track,
     PlayerUpdateEvent,
     TrackStartEvent,
     TrackEndEvent,
@@ -36,56 +39,144 @@ class WS:
         self._loop = client._loop
         self.emitter: Emitter = client.event_manager
         self.is_connect: bool = False
+        # pending messages per guild, each guild is drained in order by its own task
+        self._lanes: t.Dict[t.Optional[str], t.Deque[dict]] = {}
+        self._lane_tasks: t.Set[asyncio.Task] = set()
+        self._connect_task: t.Optional[asyncio.Task] = None
+        self._closing: bool = False
+        self._op_dispatch: t.Dict[str, t.Callable[[dict], t.Awaitable[None]]] = {
+            "stats": self._on_stats,
+            "playerUpdate": self._on_player_update,
+            "event": self._on_event,
+        }
+        self._event_dispatch: t.Dict[str, t.Callable[..., t.Awaitable[None]]] = {
+            "TrackStartEvent": self._on_track_start,
+            "TrackEndEvent": self._on_track_end,
+            "TrackExceptionEvent": self._on_track_exception,
+            "TrackStuckEvent": self._on_track_stuck,
+            "WebSocketClosedEvent": self._on_websocket_closed,
+        }
     
+    def start(self):
+        """
+        Start the connection task if it's not already running.
+        """
+        self._closing = False
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = self._loop.create_task(self._connect())
+
     async def _connect(self):
-        async with aiohttp.ClientSession(headers=self._headers, loop=self._loop) as session:
-            self.session = session
+        self.session = self.client._session
+        attempt = 0
+        while not self._closing:
             try:
-                self.ws = await self.session.ws_connect(self.ws_url)
-                if session is None:
-                    await self.check_connection()
-            except (aiohttp.ClientConnectorError, aiohttp.WSServerHandshakeError, aiohttp.ServerDisconnectedError) as error:
-                
-                if isinstance(error, aiohttp.ClientConnectorError):
-                    _LOGGER.error(f"Could not connect to websocket: {error}")
-                    _LOGGER.warning("Reconnecting to websocket after 10 seconds")  
-                    await asyncio.sleep(10)
-                    await self._connect()
-                    return
-                elif isinstance(error, aiohttp.WSServerHandshakeError):
-                    if error.status in (403, 401):  # Unauthorized or Forbidden
-                        _LOGGER.warning("Password authentication failed - closing websocket")
-                        return
-                    _LOGGER.warning("Please check your websocket port - closing websocket")
-                elif isinstance(error, aiohttp.ServerDisconnectedError):
-                    _LOGGER.error(f"Could not connect to websocket: {error}")
-                    _LOGGER.warning("Reconnecting to websocket after 10 seconds")
-                    await asyncio.sleep(10)
-                    await self._connect()
+                self.ws = await self.session.ws_connect(self.ws_url, headers=self._headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if isinstance(error, aiohttp.WSServerHandshakeError) and error.status in (403, 401):  # Unauthorized or Forbidden
+                    _LOGGER.warning("Password authentication failed - closing websocket")
+                    # stop sends from retrying the handshake, only connect() starts it again
+                    self._closing = True
                     return
+                # any other handshake status (e.g. 502/503 from a proxy while lavalink restarts) is retried
+                delay = min(2 ** attempt, 30)
+                attempt += 1
+                _LOGGER.error(f"Could not connect to websocket: {error}")
+                _LOGGER.warning(f"Reconnecting to websocket after {delay} seconds")
+                await asyncio.sleep(delay)
+                continue
 
             _LOGGER.info("Connected to websocket")
+            attempt = 0
             self.is_connect = True
-            async for msg in self.ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    await self.callback(msg.json())
-                elif msg.type == aiohttp.WSMsgType.CLOSED:
-                    _LOGGER.error("Websocket closed")
-                    break
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    _LOGGER.error(msg.data)
-                    break
+            try:
+                await self._read()
+            except Exception:
+                _LOGGER.exception("Websocket read failed")
+            finally:
+                self.is_connect = False
+            if self._closing:
+                return
+            if not self.ws.closed:
+                await self.ws.close()
 
-    async def check_connection(self):
-        while self.ws.closed is None or not self.ws.closed or not self.is_connected:
-            _LOGGER.warning("Websocket closed unexpectedly - reconnecting in 10 seconds")
+            # lavalink drops the players with the websocket, the session and its pooled connections are kept
             if self.client.nodes:
-                self.client.nodes.clear()
-            await asyncio.sleep(10)
-            await self._connect()
+                self.client._clear_nodes()
+            delay = min(2 ** attempt, 30)
+            attempt += 1
+            _LOGGER.warning(f"Websocket closed unexpectedly - reconnecting in {delay} seconds")
+            await asyncio.sleep(delay)
+
+    async def _read(self):
+        # bind the per-frame lookups to locals once, the loop runs for every frame
+        TEXT = aiohttp.WSMsgType.TEXT
+        CLOSED = aiohttp.WSMsgType.CLOSED
+        ERROR = aiohttp.WSMsgType.ERROR
+        dispatch = self._dispatch
+        loads = orjson.loads
+        async for msg in self.ws:
+            msg_type = msg.type
+            if msg_type == TEXT:
+                try:
+                    dispatch(loads(msg.data))
+                except Exception:
+                    _LOGGER.exception(f"Could not handle websocket frame: {msg.data!r}")
+            elif msg_type == CLOSED:
+                _LOGGER.error("Websocket closed")
+                break
+            elif msg_type == ERROR:
+                _LOGGER.error(msg.data)
+                break
+
+    def _dispatch(self, payload: dict):
+        # messages for one guild keep their order, different guilds don't wait on each other
+        key = payload.get("guildId")
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            task = self._loop.create_task(self._drain(key, lane))
+            self._lane_tasks.add(task)
+            task.add_done_callback(self._lane_tasks.discard)
+        lane.append(payload)
+
+    async def _drain(self, key: t.Optional[str], lane: t.Deque[dict]):
+        try:
+            while lane:
+                payload = lane.popleft()
+                try:
+                    await self.callback(payload)
+                except Exception:
+                    _LOGGER.exception("Error while handling websocket message")
+        finally:
+            if self._lanes.get(key) is lane:
+                del self._lanes[key]
+
+    async def close(self):
+        self._closing = True
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+            self._connect_task = None
+        for task in list(self._lane_tasks):
+            task.cancel()
+        self._lanes.clear()
+        if self.ws is not None and not self.ws.closed:
+            await self.ws.close()
+        self.is_connect = False
+
+    async def check_connection(self):
+        if self._closing or self.is_connected:
+            return
+        # the connection task retries with backoff, just make sure it's running
+        self.start()
 
     async def callback(self, payload: dict):
-        if payload["op"] == "stats":
+        handler = self._op_dispatch.get(payload["op"])
+        if handler is not None:
+            await handler(payload)
+
+    async def _on_stats(self, payload: dict):
+        info = self.client.info
+        if info is None:
             self.client.info = Info(
                 playing_players=payload["playingPlayers"],
                 memory_used=payload["memory"]["used"],
@@ -93,61 +184,66 @@ class WS:
                 players=payload["players"],
                 uptime=payload["uptime"]
             )
+            return
+        # reuse the same object for every stats op
+        info.playing_players = payload["playingPlayers"]
+        info.memory_used = payload["memory"]["used"]
+        info.memory_free = payload["memory"]["free"]
+        info.players = payload["players"]
+        info.uptime = payload["uptime"]
 
-        elif payload["op"] == "playerUpdate":
-            guild_id = int(payload["guildId"])
-            node = await self.client.get_guild_node(guild_id)
-            position = payload["state"].get("position")
-            if node is None:
-                return
-            
-            if node.queue:
-                node.queue[0].position = position / 1000
-                await self.client.set_guild_node(guild_id, node)
-            data = PlayerUpdateEvent(
-                guild_id=guild_id,
-                time=payload["state"]["time"],
-                position=position / 1000 if isinstance(position, int) else None,
-                connected=payload["state"].get("connected", None),
-            )
-            self.emitter.emit("playerUpdateEvent", data)
-
-        elif payload["op"] == "event":
+    async def _on_player_update(self, payload: dict):
+        guild_id = int(payload["guildId"])
+        node = self.client._nodes.get(guild_id)
+        position = payload["state"].get("position")
+        if node is None:
+            return
+        
+        if node.queue:
+            node.queue[0].position = position / 1000
+        data = PlayerUpdateEvent(
+            guild_id=guild_id,
+            time=payload["state"]["time"],
+            position=position / 1000 if isinstance(position, int) else None,
+            connected=payload["state"].get("connected", None),
+        )
+        self.emitter.emit("playerUpdateEvent", data)
 
-            if not payload.get("track"):
-                return
-            track = await self.client._decodetrack(payload["track"])
-            guild_id = int(payload["guildId"])
-            try:
-                node = await self.client.get_guild_node(guild_id)
-            except NodeError:
-                node = None
+    async def _on_event(self, payload: dict):
+        handler = self._event_dispatch.get(payload["type"])
+        if handler is None:
+            return
+        if not payload.get("track"):
+            return
+        track = await self.client._decodetrack(payload["track"])
+        guild_id = int(payload["guildId"])
+        node = self.client._nodes.get(guild_id)
+        await handler(payload, track, guild_id, node)
 
-            if payload["type"] == "TrackStartEvent":
-                self.emitter.emit("TrackStartEvent", TrackStartEvent(track, guild_id))
+    async def _on_track_start(self, payload: dict, track: Track, guild_id: int, node: t.Optional[Node]):
+        self.emitter.emit("TrackStartEvent", TrackStartEvent(track, guild_id))
 
-            elif payload["type"] == "TrackEndEvent":
-                self.emitter.emit("TrackEndEvent", TrackEndEvent(track, guild_id, payload["reason"]))
-                if not node:
-                    return
-                if not node.queue:
-                    return
-                if node.repeat:
-                    await self.client.play(guild_id, track, node.queue[0].requester, True)
-                    return
-                del node.queue[0]
-                await self.client.set_guild_node(guild_id, node)
-                if len(node.queue) != 0:
-                    await self.client.play(guild_id, node.queue[0], node.queue[0].requester, True)
+    async def _on_track_end(self, payload: dict, track: Track, guild_id: int, node: t.Optional[Node]):
+        self.emitter.emit("TrackEndEvent", TrackEndEvent(track, guild_id, payload["reason"]))
+        if not node:
+            return
+        if not node.queue:
+            return
+        if node.repeat:
+            await self.client.play(guild_id, track, node.queue[0].requester, True)
+            return
+        del node.queue[0]
+        if len(node.queue) != 0:
+            await self.client.play(guild_id, node.queue[0], node.queue[0].requester, True)
 
-            elif payload["type"] == "TrackExceptionEvent":
-                self.emitter.emit("TrackExceptionEvent", TrackExceptionEvent(track, guild_id, payload["exception"], payload.get("message"), payload.get("severity"), payload.get("cause")))
+    async def _on_track_exception(self, payload: dict, track: Track, guild_id: int, node: t.Optional[Node]):
+        self.emitter.emit("TrackExceptionEvent", TrackExceptionEvent(track, guild_id, payload["exception"], payload.get("message"), payload.get("severity"), payload.get("cause")))
 
-            elif payload["type"] == "TrackStuckEvent":
-                self.emitter.emit("TrackStuckEvent", TrackStuckEvent(track, guild_id, payload["thresholdMs"]))
+    async def _on_track_stuck(self, payload: dict, track: Track, guild_id: int, node: t.Optional[Node]):
+        self.emitter.emit("TrackStuckEvent", TrackStuckEvent(track, guild_id, payload["thresholdMs"]))
 
-            elif payload["type"] == "WebSocketClosedEvent":
-                self.emitter.emit("WebSocketClosedEvent", WebSocketClosedEvent(track, guild_id, payload["code"], payload["reason"], payload["byRemote"]))
+    async def _on_websocket_closed(self, payload: dict, track: Track, guild_id: int, node: t.Optional[Node]):
+        self.emitter.emit("WebSocketClosedEvent", WebSocketClosedEvent(track, guild_id, payload["code"], payload["reason"], payload["byRemote"]))
 
     @property
     def is_connected(self) -> bool:
@@ -159,7 +255,7 @@ class WS:
             await self.check_connection()
             return
         try:
-            await self.ws.send_json(payload)
+            await self.ws.send_str(orjson.dumps(payload).decode())
         except ConnectionResetError:
             _LOGGER.error("ConnectionResetError: Cannot write to closing transport")
             await self.check_connection()
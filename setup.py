@@ -28,7 +28,7 @@ setup(
     ],
     keywords='lavalink, discord, discord-lavalink, lavaplayer',
     packages=["lavaplayer"],
-    install_requires=["aiohttp"],
+    install_requires=["aiohttp", "orjson"],
     project_urls={
         'Bug Reports': 'https://github.com/HazemMeqdad/lavaplayer/issues',
         'Source': 'https://github.com/HazemMeqdad/lavaplayer/',